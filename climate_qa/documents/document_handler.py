@@ -110,9 +110,17 @@ class DocumentHandler:
         file_name = f"{self.document.filename}.json"
         file_path = os.path.join(stored_documents_path, file_name)
 
-        # Write the data to a json file
-        with open(file_path, "w") as f:
-            json.dump(data, f)
+        # Write the data to a temporary file and move it into place so readers
+        # never see a partially written json file
+        tmp_path = f"{file_path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
     def process_document(self, dir_path: Union[str, None] = None) -> None:
         """
@@ -1,23 +1,136 @@
 import json
 import os
-from typing import Dict, List, Optional
+import threading
+import warnings
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
-from ..utils import EmbeddingGenerator, cosine_similarity
+from ..utils import EmbeddingGenerator, LRUCache, cosine_similarity
 
 
 class DocumentSearch:
-    def __init__(self, document_dir: str):
+    def __init__(self, document_dir: str,
+                 embedding_cache_size: int = 1024,
+                 result_cache_size: int = 256):
         """
         Initializes the DocumentSearch with a directory containing JSON files.
 
         Parameters:
         document_dir (str): Directory containing JSON files with document data.
+        embedding_cache_size (int, optional): Maximum number of query
+                                              embeddings to keep cached.
+        result_cache_size (int, optional): Maximum number of search results
+                                           to keep cached.
         """
+        self.document_dir = document_dir
+        self._corpus_lock = threading.Lock()
+        self._failed_version: Optional[Tuple[Tuple[str, int, int], ...]] = None
+        self.corpus_version = self._corpus_version()
         self.documents_df = self._load_documents(document_dir)
         self.embedding_generator = EmbeddingGenerator()
+        self.embedding_cache = LRUCache(maxsize=embedding_cache_size)
+        self.result_cache = LRUCache(maxsize=result_cache_size)
+
+    def _corpus_version(self) -> Tuple[Tuple[str, int, int], ...]:
+        """
+        Computes a version stamp for the stored corpus from the name,
+        modification time and size of each JSON file in the document directory.
+
+        Returns:
+        tuple: A hashable stamp that changes whenever the stored corpus changes.
+        """
+        version = []
+        for filename in sorted(os.listdir(self.document_dir)):
+            if filename.endswith(".json"):
+                stat = os.stat(os.path.join(self.document_dir, filename))
+                version.append((filename, stat.st_mtime_ns, stat.st_size))
+        return tuple(version)
+
+    def _refresh_corpus(self) -> Tuple[pd.DataFrame, Tuple[Tuple[str, int, int], ...]]:
+        """
+        Reloads the documents and drops cached search results if the stored
+        corpus has changed since it was last loaded.
+
+        If the document directory cannot be listed or a file vanishes while
+        it is being stat'ed, the currently loaded documents are kept and the
+        refresh is retried on the next call. If the changed corpus cannot be
+        loaded (e.g. a file is not valid JSON), the currently loaded documents
+        are kept and the failing version is not retried until the stored
+        files change again. Both cases emit a warning.
+
+        Returns:
+        tuple: The loaded documents and the corpus version they belong to.
+        """
+        with self._corpus_lock:
+            try:
+                version = self._corpus_version()
+            except OSError as e:
+                warnings.warn(f"Could not check stored documents in "
+                              f"{self.document_dir}, keeping the loaded corpus: {e}")
+                return self.documents_df, self.corpus_version
+
+            if version != self.corpus_version and version != self._failed_version:
+                try:
+                    documents_df = self._load_documents(self.document_dir)
+                except (OSError, ValueError, KeyError) as e:
+                    self._failed_version = version
+                    warnings.warn(f"Could not load stored documents in "
+                                  f"{self.document_dir}, keeping the loaded corpus "
+                                  f"until the files change again: {e!r}")
+                else:
+                    self.documents_df, self.corpus_version = documents_df, version
+                    self._failed_version = None
+                    self.result_cache.clear()
+            return self.documents_df, self.corpus_version
+
+    @staticmethod
+    def _copy_result(result: pd.DataFrame) -> pd.DataFrame:
+        """
+        Copies a search result, including the embedding arrays, so callers
+        cannot modify a cached entry.
+
+        Parameters:
+        result (pd.DataFrame): The search result to copy.
+
+        Returns:
+        pd.DataFrame: A deep copy of the search result.
+        """
+        result = result.copy()
+        result["embedding"] = result["embedding"].apply(np.copy)
+        return result
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """
+        Returns the embedding for the given query, reusing a cached embedding
+        when the same query has already been encoded with the same model.
+
+        Parameters:
+        query (str): The normalized query to embed.
+
+        Returns:
+        np.ndarray: The query embedding.
+        """
+        key = (query, self.embedding_generator.model_name)
+        embedding = self.embedding_cache.get(key)
+        if embedding is None:
+            embedding = self.embedding_generator.generate_embeddings([query])[0]
+            self.embedding_cache.put(key, embedding)
+        return embedding
+
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        Returns hit-rate statistics for the query embedding and search result
+        caches.
+
+        Returns:
+        dict: Statistics keyed by "embeddings" and "results".
+        """
+        return {
+            "embeddings": self.embedding_cache.info(),
+            "results": self.result_cache.info(),
+        }
 
     def _load_documents(self, document_dir: str) -> pd.DataFrame:
         """
@@ -40,31 +153,47 @@ class DocumentSearch:
 
     def vector_search(self, query: str,
                       data: Optional[pd.DataFrame] = None,
-                      top_n: Optional[int] = None) -> pd.DataFrame:
+                      top_n: Optional[int] = None,
+                      filters: Optional[Dict[str, str]] = None) -> pd.DataFrame:
         """
         Performs a vector search with the given query.
 
+        Searches over the stored documents are cached per (query, filters,
+        top_n, corpus version) and are invalidated when the stored corpus
+        changes. Cached results are returned as deep copies, including the
+        embedding arrays. Searches over a caller-supplied DataFrame are not
+        cached.
+
         Parameters:
         query (str): The query to search for.
         data (pd.DataFrame, optional): The DataFrame to perform the search on.
                                        If None, self.documents_df is used.
         top_n (int, optional): The number of top documents to return. If None,
                                all documents are returned.
+        filters (dict, optional): Metadata filters applied before searching,
+                                  as accepted by filter_metadata.
 
         Returns:
         pd.DataFrame: A DataFrame sorted by similarity to the query, from most to least similar.
         """
-
-        if not data:
-            data = self.documents_df
-
-        # for the type checker
-        assert data is not None
-        
-        query_embedding = self.embedding_generator.generate_embeddings([query])[0]
-        data["similarity"] = data["embedding"].apply(
+        query = " ".join(query.split())
+
+        key = None
+        if data is None:
+            data, version = self._refresh_corpus()
+            key = (query, tuple(sorted((filters or {}).items())),
+                   top_n, version)
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                return self._copy_result(cached)
+
+        if filters:
+            data = self._apply_filters(data, filters)
+
+        query_embedding = self._embed_query(query)
+        data = data.assign(similarity=data["embedding"].apply(
             lambda x: cosine_similarity(x, query_embedding)
-        )
+        ))
 
         # Sort DataFrame by similarity and return top N rows
         sorted_df = data.sort_values(by="similarity", ascending=False)
@@ -73,6 +202,10 @@ class DocumentSearch:
         if top_n is not None:
             sorted_df = sorted_df.head(top_n)
 
+        if key is not None:
+            self.result_cache.put(key, sorted_df)
+            return self._copy_result(sorted_df)
+
         return sorted_df
 
     def filter_metadata(self, filters: Dict[str, str]) -> pd.DataFrame:
@@ -86,9 +219,22 @@ class DocumentSearch:
         Returns:
         pd.DataFrame: DataFrame containing only the rows that meet the filters.
         """
-        filtered_df = self.documents_df
+        return self._apply_filters(self.documents_df, filters)
+
+    @staticmethod
+    def _apply_filters(data: pd.DataFrame, filters: Dict[str, str]) -> pd.DataFrame:
+        """
+        Keeps only the rows of data that match every metadata filter.
+
+        Parameters:
+        data (pd.DataFrame): The DataFrame to filter.
+        filters (dict): Dictionary of filters, where each key-value pair represents
+                        a column name and a value to filter on.
 
+        Returns:
+        pd.DataFrame: DataFrame containing only the rows that meet the filters.
+        """
         for key, value in filters.items():
-            filtered_df = filtered_df[filtered_df[key] == value]
+            data = data[data[key] == value]
 
-        return filtered_df
+        return data
@@ -1,6 +1,8 @@
 import os
 import re
-from typing import List
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List
 
 import numpy as np
 import openai
@@ -35,6 +37,96 @@ class EmbeddingGenerator:
         return self.model.encode(text)
 
 
+class LRUCache:
+    """
+    A bounded, in-process least-recently-used cache that keeps hit/miss
+    statistics. All operations are guarded by a lock so a single instance can
+    be shared between threads.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initializes an empty LRUCache.
+
+        Parameters:
+        maxsize (int): Maximum number of entries to keep. The least recently
+                       used entry is evicted once this is exceeded. A
+                       maxsize of 0 disables caching.
+
+        Raises:
+        ValueError: If maxsize is negative.
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative, got {maxsize}")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for key, marking it as most recently used.
+
+        Parameters:
+        key (Hashable): The cache key.
+        default (Any, optional): Value returned if key is not cached.
+
+        Returns:
+        Any: The cached value, or default on a miss.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores value under key, evicting the least recently used entry if the
+        cache is full.
+
+        Parameters:
+        key (Hashable): The cache key.
+        value (Any): The value to cache.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries. Hit/miss statistics are kept."""
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> Dict[str, Any]:
+        """
+        Returns cache statistics.
+
+        Returns:
+        dict: hits, misses, hit_rate, size and maxsize of the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     """computes the cosine similarity between vectors a and b"""
     return np.dot(a, b) / (norm(a) * norm(b))
@@ -0,0 +1,131 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+import climate_qa.utils
+from climate_qa.search import DocumentSearch
+from climate_qa.utils import LRUCache
+
+
+class FakeSentenceTransformer:
+    """Stands in for SentenceTransformer and counts encode calls."""
+
+    calls = 0
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def encode(self, text):
+        FakeSentenceTransformer.calls += 1
+        return np.array([[len(t), t.count("a") + 1.0] for t in text], dtype=float)
+
+
+def write_documents(dir_path, filename, texts, title="report"):
+    data = [
+        {"title": title, "text": text, "embedding": [len(text), i + 1.0]}
+        for i, text in enumerate(texts)
+    ]
+    path = os.path.join(dir_path, filename)
+    with open(path, "w") as f:
+        json.dump(data, f)
+    return path
+
+
+def bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def search(tmp_path, monkeypatch):
+    monkeypatch.setattr(climate_qa.utils, "SentenceTransformer", FakeSentenceTransformer)
+    FakeSentenceTransformer.calls = 0
+    write_documents(tmp_path, "a.json", ["sea level", "heat", "drought"])
+    return DocumentSearch(document_dir=str(tmp_path))
+
+
+def test_repeated_query_skips_encode(search):
+    first = search.vector_search("sea level rise", top_n=2)
+    second = search.vector_search("  sea   level rise ", top_n=2)
+
+    assert FakeSentenceTransformer.calls == 1
+    assert list(first["text"]) == list(second["text"])
+    info = search.cache_info()
+    assert info["results"]["hits"] == 1
+    assert info["results"]["misses"] == 1
+
+
+def test_embedding_cache_is_shared_across_top_n_and_filters(search):
+    all_results = search.vector_search("heat")
+    top_one = search.vector_search("heat", top_n=1)
+    filtered = search.vector_search("heat", filters={"title": "other"})
+
+    assert FakeSentenceTransformer.calls == 1
+    assert len(all_results) == 3
+    assert len(top_one) == 1
+    assert len(filtered) == 0
+    assert search.cache_info()["results"]["size"] == 3
+
+
+def test_cached_result_cannot_be_mutated_by_caller(search):
+    result = search.vector_search("heat", top_n=1)
+    result["embedding"].iloc[0][0] = -1.0
+    result["text"] = "changed"
+
+    cached = search.vector_search("heat", top_n=1)
+    assert cached["embedding"].iloc[0][0] != -1.0
+    assert cached["text"].iloc[0] != "changed"
+
+
+def test_corpus_change_invalidates_results(search, tmp_path):
+    assert len(search.vector_search("heat")) == 3
+
+    path = write_documents(tmp_path, "a.json", ["sea level", "heat", "drought", "floods"])
+    bump_mtime(path)
+
+    assert len(search.vector_search("heat")) == 4
+    assert FakeSentenceTransformer.calls == 1
+
+
+def test_unreadable_corpus_keeps_loaded_documents(search, tmp_path, monkeypatch):
+    search.vector_search("heat")
+    with open(tmp_path / "b.json", "w") as f:
+        f.write("{not json")
+
+    loads = []
+    load_documents = search._load_documents
+    monkeypatch.setattr(search, "_load_documents",
+                        lambda d: loads.append(d) or load_documents(d))
+
+    with pytest.warns(UserWarning, match="Could not load stored documents"):
+        result = search.vector_search("heat")
+    for _ in range(4):
+        search.vector_search("heat")
+
+    assert len(result) == 3
+    assert len(loads) == 1
+
+    # fixing the file changes the corpus version and triggers a new reload
+    path = write_documents(tmp_path, "b.json", ["wildfires"])
+    bump_mtime(path)
+    assert len(search.vector_search("heat")) == 4
+    assert len(loads) == 2
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.info()["size"] == 2
+
+
+def test_lru_cache_rejects_negative_maxsize():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)